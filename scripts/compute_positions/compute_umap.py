@@ -8,12 +8,37 @@ positioned close together in 3D space.
 This is the core of "ideaspace navigation" - position encodes meaning.
 """
 
+import functools
+import hashlib
+import json
+import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple
-from sklearn.neighbors import NearestNeighbors
+from numba import config as numba_config, njit, prange, set_num_threads
+from pynndescent import NNDescent
+from threadpoolctl import threadpool_limits
 import umap
-from tqdm import tqdm
+
+try:
+    from cuml.manifold import UMAP as cuUMAP
+    from cuml.neighbors import NearestNeighbors as cuNearestNeighbors
+    HAS_CUML = True
+except ImportError:
+    HAS_CUML = False
+
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+try:
+    import hnswlib
+    HAS_HNSWLIB = True
+except ImportError:
+    HAS_HNSWLIB = False
 
 from config import (
     MODELS,
@@ -28,6 +53,7 @@ from config import (
 def compute_umap_positions(
     decoder_vectors: np.ndarray,
     params: Optional[UMAPParams] = None,
+    precomputed_knn: Optional[Tuple[np.ndarray, np.ndarray]] = None,
     verbose: bool = True,
 ) -> np.ndarray:
     """
@@ -36,6 +62,9 @@ def compute_umap_positions(
     Args:
         decoder_vectors: Shape (num_features, d_model), L2-normalized
         params: UMAP hyperparameters
+        precomputed_knn: Optional (indices, distances) kNN graph with at
+            least n_neighbors columns; skips UMAP's internal kNN build.
+            Ignored on the GPU path (cuML builds its own).
         verbose: Print progress
 
     Returns:
@@ -44,11 +73,40 @@ def compute_umap_positions(
     if params is None:
         params = DEFAULT_UMAP_PARAMS
 
+    # UMAP and the kNN search are memory-bandwidth-bound; fp32 halves DRAM
+    # traffic vs fp64 with no visible effect on the layout
+    decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+
     if verbose:
         print(f"Computing UMAP for {decoder_vectors.shape[0]} features...")
         print(f"Parameters: n_neighbors={params.n_neighbors}, min_dist={params.min_dist}, metric={params.metric}")
 
+    # GPU path: cuML's nn_descent-backed UMAP runs the kNN build and the
+    # layout SGD as CUDA kernels (seconds vs minutes for a 16k layer)
+    if params.use_gpu:
+        if HAS_CUML:
+            reducer = cuUMAP(
+                n_neighbors=params.n_neighbors,
+                min_dist=params.min_dist,
+                n_components=params.n_components,
+                metric=params.metric,
+                spread=params.spread,
+                repulsion_strength=params.repulsion_strength,
+                random_state=params.random_state,
+                build_algo="nn_descent",
+                verbose=verbose,
+            )
+            positions = np.asarray(reducer.fit_transform(decoder_vectors))
+            if verbose:
+                print(f"UMAP (GPU) complete. Output shape: {positions.shape}")
+            return positions
+        print("cuML not installed - falling back to CPU UMAP")
+
     # Initialize UMAP
+    knn_tuple = (None, None, None)
+    if precomputed_knn is not None:
+        knn_tuple = (precomputed_knn[0], precomputed_knn[1], None)
+
     reducer = umap.UMAP(
         n_neighbors=params.n_neighbors,
         min_dist=params.min_dist,
@@ -59,6 +117,7 @@ def compute_umap_positions(
         random_state=params.random_state,
         n_jobs=params.n_jobs,
         low_memory=params.low_memory,
+        precomputed_knn=knn_tuple,
         verbose=verbose,
     )
 
@@ -87,24 +146,358 @@ def normalize_positions(
     Returns:
         Normalized positions
     """
-    # Center at origin
-    positions = positions - positions.mean(axis=0)
+    # Single owned fp32 copy, then center and scale in place - avoids the
+    # three temporaries the naive subtract/abs/multiply chain allocates
+    positions = np.array(positions, dtype=np.float32, copy=True)
+    positions -= positions.mean(axis=0)
 
     # Scale to fit within target range
-    max_abs = np.abs(positions).max()
+    max_abs = float(np.max(np.abs(positions)))
     if max_abs > 0:
         target_max = target_range[1]
-        positions = positions * (target_max / max_abs)
+        positions *= target_max / max_abs
 
     return positions
 
 
+def _knn_blocked(
+    decoder_vectors: np.ndarray,
+    k: int,
+    block_size: int = 1024,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact cosine kNN via blocked matmul + top-K partition.
+
+    Since vectors are L2-normalized, similarity is just X @ X.T. Computing
+    it in row blocks keeps each similarity slab at block_size x N (~64 MB
+    for a 16k layer) instead of materializing the full N x N matrix, and
+    the matmul runs on threaded BLAS.
+    """
+    n = decoder_vectors.shape[0]
+    indices = np.empty((n, k), dtype=np.int64)
+    distances = np.empty((n, k), dtype=np.float32)
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        sims = decoder_vectors[start:stop] @ decoder_vectors.T
+
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(sims, top, axis=1)
+        order = np.argsort(-top_sims, axis=1)
+
+        indices[start:stop] = np.take_along_axis(top, order, axis=1)
+        distances[start:stop] = 1.0 - np.take_along_axis(top_sims, order, axis=1)
+
+    return indices, distances
+
+
+def compute_knn(
+    decoder_vectors: np.ndarray,
+    k: int,
+    random_state: int = 42,
+    use_gpu: bool = False,
+    backend: str = "auto",
+    index_path: Optional[Path] = None,
+    verbose: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the k-NN graph over decoder vectors.
+
+    Backends:
+        "faiss": exact search via IndexFlatIP. On L2-normalized vectors
+            inner product == cosine similarity, so this keeps the exact
+            semantics of the old brute-force path while running on
+            BLAS/SIMD kernels.
+        "faiss-sq8": like "faiss" but over int8 scalar-quantized vectors.
+            Cosine top-K at k=25 is robust to 8-bit quantization, and the
+            4x smaller index halves memory bandwidth during search.
+        "blocked": exact search via blocked X @ X.T matmul + top-K
+            partition; no extra dependency, threaded BLAS.
+        "hnsw": approximate HNSW graph via hnswlib. Construction cost is
+            amortized through index_path, after which queries are the
+            fastest of any ANN option - best for repeated sweeps over the
+            same vector set.
+        "pynndescent": approximate NN-descent, the same construction UMAP
+            runs internally; near-linear in N.
+        "auto": faiss when installed, pynndescent otherwise.
+
+    Args:
+        decoder_vectors: Shape (num_features, d_model), L2-normalized
+        k: Number of neighbors (including self)
+        random_state: Seed for reproducibility (pynndescent only)
+        use_gpu: Use cuML brute-force kNN on GPU (falls back to CPU)
+        backend: CPU kNN backend, see above
+        index_path: Where to persist/reload the search index
+            (hnsw backend only)
+        verbose: Print progress
+
+    Returns:
+        Tuple of (indices, distances), each shape (num_features, k).
+        Distances are cosine distances (1 - similarity).
+    """
+    if use_gpu:
+        if HAS_CUML:
+            nn = cuNearestNeighbors(n_neighbors=k, metric="cosine")
+            nn.fit(decoder_vectors)
+            distances, indices = nn.kneighbors(decoder_vectors)
+            return np.asarray(indices), np.asarray(distances)
+        print("cuML not installed - falling back to CPU kNN")
+
+    if backend == "auto":
+        backend = "faiss" if HAS_FAISS else "pynndescent"
+
+    if backend in ("faiss", "faiss-sq8"):
+        if not HAS_FAISS:
+            raise ImportError(f"{backend} backend requested but faiss-cpu is not installed")
+        decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+        if backend == "faiss-sq8":
+            index = faiss.IndexScalarQuantizer(
+                decoder_vectors.shape[1],
+                faiss.ScalarQuantizer.QT_8bit,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+            index.train(decoder_vectors)
+        else:
+            index = faiss.IndexFlatIP(decoder_vectors.shape[1])
+        index.add(decoder_vectors)
+        similarities, indices = index.search(decoder_vectors, k)
+        return indices, 1.0 - similarities
+
+    if backend == "blocked":
+        decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+        return _knn_blocked(decoder_vectors, k)
+
+    if backend == "hnsw":
+        if not HAS_HNSWLIB:
+            raise ImportError("hnsw backend requested but hnswlib is not installed")
+        decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+        num_features = decoder_vectors.shape[0]
+
+        index = hnswlib.Index(space="cosine", dim=decoder_vectors.shape[1])
+        if index_path is not None and index_path.exists():
+            if verbose:
+                print(f"Loading HNSW index from {index_path}")
+            index.load_index(str(index_path), max_elements=num_features)
+        else:
+            index.init_index(max_elements=num_features, ef_construction=200, M=16)
+            index.add_items(decoder_vectors)
+            if index_path is not None:
+                index.save_index(str(index_path))
+                if verbose:
+                    print(f"Saved HNSW index to {index_path}")
+
+        index.set_ef(max(64, k))
+        indices, distances = index.knn_query(decoder_vectors, k=k)
+        return indices.astype(np.int64), distances.astype(np.float32)
+
+    if backend != "pynndescent":
+        raise ValueError(f"Unknown kNN backend: {backend}")
+
+    index = NNDescent(
+        decoder_vectors,
+        n_neighbors=k,
+        metric="cosine",
+        n_jobs=-1,
+        low_memory=False,
+        random_state=random_state,
+        verbose=verbose,
+    )
+    indices, distances = index.neighbor_graph
+    return indices, distances
+
+
+@njit(cache=True)
+def _threshold_candidates(indices, distances, min_similarity):
+    """
+    Fused threshold pass over the kNN graph (column 0 is self).
+
+    Converts distances to similarities, applies the threshold and compacts
+    survivors into packed arrays in a single JIT-compiled loop, so the full
+    N x top_k candidate arrays are never materialized.
+    """
+    n, k = indices.shape
+    src = np.empty(n * (k - 1), dtype=np.int32)
+    tgt = np.empty(n * (k - 1), dtype=np.int32)
+    weights = np.empty(n * (k - 1), dtype=np.float32)
+    count = 0
+    for i in range(n):
+        for j_idx in range(1, k):
+            similarity = 1.0 - distances[i, j_idx]
+            if similarity >= min_similarity:
+                src[count] = i
+                tgt[count] = indices[i, j_idx]
+                weights[count] = similarity
+                count += 1
+    return src[:count], tgt[:count], weights[:count]
+
+
+def _range_search_candidates(
+    decoder_vectors: np.ndarray,
+    top_k: int,
+    min_similarity: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generate thresholded edge candidates via FAISS range search.
+
+    Instead of fetching top_k+1 neighbors per feature and discarding the
+    ones below min_similarity, range search only ever returns pairs at or
+    above the threshold. Survivors are then capped to the top_k strongest
+    per source row with a vectorized rank pass.
+
+    Returns:
+        Tuple of (src, tgt, weights) arrays
+    """
+    decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+    num_features = decoder_vectors.shape[0]
+
+    index = faiss.IndexFlatIP(decoder_vectors.shape[1])
+    index.add(decoder_vectors)
+    # radius is exclusive for inner product; nudge down to keep == threshold
+    radius = np.nextafter(np.float32(min_similarity), np.float32(-np.inf))
+    lims, sims, ids = index.range_search(decoder_vectors, float(radius))
+
+    counts = np.diff(lims).astype(np.int64)  # lims is uint64
+    src = np.repeat(np.arange(num_features, dtype=np.int64), counts)
+    tgt = ids
+    weights = sims
+
+    # Drop self matches
+    mask = src != tgt
+    src = src[mask]
+    tgt = tgt[mask]
+    weights = weights[mask]
+
+    # Cap each source row to its top_k strongest survivors
+    order = np.lexsort((-weights, src))
+    src = src[order]
+    tgt = tgt[order]
+    weights = weights[order]
+
+    boundaries = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+    row_start = np.repeat(boundaries, np.diff(np.r_[boundaries, src.size]))
+    rank = np.arange(src.size) - row_start
+    keep = rank < top_k
+
+    return src[keep], tgt[keep], weights[keep]
+
+
+def _dedup_edges(
+    src: np.ndarray,
+    tgt: np.ndarray,
+    weights: np.ndarray,
+    num_features: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drop bidirectional duplicates, keeping first occurrences in order.
+
+    Maps each (i, j) pair to an order-independent int64 key (min*N + max)
+    and selects the first occurrence per key with a single C-level sort.
+    """
+    lo = np.minimum(src, tgt).astype(np.int64)
+    hi = np.maximum(src, tgt).astype(np.int64)
+    pair_keys = lo * num_features + hi
+    _, keep = np.unique(pair_keys, return_index=True)
+    keep.sort()
+    return src[keep], tgt[keep], weights[keep]
+
+
+def _vectors_fingerprint(decoder_vectors: np.ndarray) -> str:
+    """Content fingerprint for the decoder vectors."""
+    # This gates kNN-cache and HNSW-index reuse, so it must see every row:
+    # SAE decoders routinely contain dead (all-zero) features, and a
+    # prefix hash would wave through a changed layer whose first rows
+    # happen to match. Hashing through a memoryview copies nothing, and
+    # BLAKE2 over the full ~150 MB buffer is ~0.1 s against minutes of
+    # UMAP.
+    arr = np.ascontiguousarray(decoder_vectors)
+    h = hashlib.blake2b(digest_size=8)
+    h.update(memoryview(arr).cast("B"))
+    h.update(f"{arr.shape}:{arr.dtype}".encode())
+    return h.hexdigest()
+
+
+def load_or_compute_knn(
+    decoder_vectors: np.ndarray,
+    k: int,
+    cache_path: Path,
+    random_state: int = 42,
+    backend: str = "auto",
+    verbose: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the kNN graph, caching it on disk keyed by the decoder vectors.
+
+    The kNN graph depends only on the (immutable) decoder vectors, the
+    metric and k - not on UMAP hyperparameters - so it survives min_dist /
+    spread / n_neighbors sweeps. A cached graph with k' >= k is reused by
+    slicing its first k columns.
+
+    Returns:
+        Tuple of (indices, distances), each shape (num_features, k)
+    """
+    meta_path = cache_path / "knn_meta.json"
+    indices_path = cache_path / "knn_indices.npy"
+    dists_path = cache_path / "knn_dists.npy"
+
+    fingerprint = _vectors_fingerprint(decoder_vectors)
+    if backend == "auto":
+        backend = "faiss" if HAS_FAISS else "pynndescent"
+
+    if meta_path.exists() and indices_path.exists() and dists_path.exists():
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        if (
+            meta.get("fingerprint") == fingerprint
+            and meta.get("metric") == "cosine"
+            and meta.get("backend") == backend
+            and meta.get("k", 0) >= k
+        ):
+            if verbose:
+                print(f"Loading cached kNN graph from {indices_path}")
+            indices = np.load(indices_path)[:, :k]
+            distances = np.load(dists_path)[:, :k]
+            return indices, distances
+
+    cache_path.mkdir(parents=True, exist_ok=True)
+
+    index_path = None
+    if backend == "hnsw":
+        # The persisted index is only valid for the vectors it was built
+        # from: key the filename by fingerprint and drop stale indexes so
+        # a rebuilt layer can never be queried against an old index
+        index_path = cache_path / f"hnsw_index_{fingerprint}.bin"
+        for stale in cache_path.glob("hnsw_index*.bin"):
+            if stale != index_path:
+                stale.unlink()
+
+    indices, distances = compute_knn(
+        decoder_vectors, k,
+        random_state=random_state,
+        backend=backend,
+        index_path=index_path,
+        verbose=verbose,
+    )
+
+    np.save(indices_path, indices)
+    np.save(dists_path, distances)
+    with open(meta_path, "w") as f:
+        json.dump(
+            {"fingerprint": fingerprint, "metric": "cosine", "backend": backend, "k": k},
+            f,
+        )
+    if verbose:
+        print(f"Cached kNN graph to {indices_path}")
+
+    return indices, distances
+
+
 def compute_edges(
     decoder_vectors: np.ndarray,
     positions: np.ndarray,
     params: Optional[EdgeParams] = None,
+    precomputed_knn: Optional[Tuple[np.ndarray, np.ndarray]] = None,
     verbose: bool = True,
-) -> list[dict]:
+) -> dict[str, np.ndarray]:
     """
     Compute edges between features based on cosine similarity.
 
@@ -115,65 +508,98 @@ def compute_edges(
         decoder_vectors: Shape (num_features, d_model), L2-normalized
         positions: Shape (num_features, 3) - for reference
         params: Edge computation parameters
+        precomputed_knn: Optional (indices, distances) kNN graph with at
+            least top_k + 1 columns; skips the kNN build entirely
 
     Returns:
-        List of edge dicts: {source: int, target: int, weight: float}
+        Structure-of-arrays dict with parallel arrays:
+        {source: int32, target: int32, weight: float32}
     """
     if params is None:
         params = DEFAULT_EDGE_PARAMS
 
+    decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
     num_features = decoder_vectors.shape[0]
 
     if verbose:
         print(f"Computing top-{params.top_k} edges for {num_features} features...")
 
-    # Use NearestNeighbors with cosine metric
+    # Approximate k-NN via NN-descent (cosine metric)
     # Since vectors are L2-normalized, cosine similarity = dot product
     # cosine distance = 1 - cosine similarity
-    nn = NearestNeighbors(
-        n_neighbors=params.top_k + 1,  # +1 because each point is its own neighbor
-        metric="cosine",
-        algorithm="auto",
-        n_jobs=-1,
-    )
-    nn.fit(decoder_vectors)
-
-    # Find neighbors
-    distances, indices = nn.kneighbors(decoder_vectors)
-
-    # Convert distances to similarities
-    # cosine_distance = 1 - cosine_similarity
-    similarities = 1 - distances
+    # +1 because each point is its own nearest neighbor
+    if precomputed_knn is not None:
+        knn_indices, knn_dists = precomputed_knn
+        if knn_indices.shape[1] < params.top_k + 1:
+            raise ValueError(
+                f"precomputed_knn has {knn_indices.shape[1]} neighbors, "
+                f"need top_k + 1 = {params.top_k + 1}"
+            )
+        indices = knn_indices[:, : params.top_k + 1]
+        distances = knn_dists[:, : params.top_k + 1]
+        src, tgt, weights = _threshold_candidates(
+            np.ascontiguousarray(indices),
+            np.ascontiguousarray(distances, dtype=np.float32),
+            params.min_similarity,
+        )
+    elif HAS_FAISS and not params.use_gpu and params.min_similarity > 0:
+        # Let the index apply the threshold: range search never returns
+        # candidates below min_similarity in the first place
+        src, tgt, weights = _range_search_candidates(
+            decoder_vectors, params.top_k, params.min_similarity
+        )
+    else:
+        indices, distances = compute_knn(
+            decoder_vectors, params.top_k + 1, use_gpu=params.use_gpu, verbose=verbose
+        )
+        # Threshold + compact in one fused JIT pass
+        # (cosine_distance = 1 - cosine_similarity)
+        src, tgt, weights = _threshold_candidates(
+            np.ascontiguousarray(indices),
+            np.ascontiguousarray(distances, dtype=np.float32),
+            params.min_similarity,
+        )
 
-    edges = []
-    seen_pairs = set() if params.deduplicate else None
+    # Deduplicate bidirectional edges; with deduplicate=False the path is
+    # just the thresholded arrays, no key computation or sort at all
+    if params.deduplicate:
+        src, tgt, weights = _dedup_edges(src, tgt, weights, num_features)
 
-    for i in tqdm(range(num_features), desc="Building edges", disable=not verbose):
-        for j_idx in range(1, params.top_k + 1):  # Skip self (index 0)
-            j = indices[i, j_idx]
-            similarity = similarities[i, j_idx]
+    edges = {
+        "source": src.astype(np.int32),
+        "target": tgt.astype(np.int32),
+        "weight": weights.astype(np.float32),
+    }
 
-            # Apply threshold
-            if similarity < params.min_similarity:
-                continue
+    if verbose:
+        print(f"Created {edges['source'].size} edges (threshold={params.min_similarity})")
 
-            # Deduplicate bidirectional edges
-            if params.deduplicate:
-                pair = (min(i, j), max(i, j))
-                if pair in seen_pairs:
-                    continue
-                seen_pairs.add(pair)
+    return edges
 
-            edges.append({
-                "source": int(i),
-                "target": int(j),
-                "weight": float(similarity),
-            })
 
-    if verbose:
-        print(f"Created {len(edges)} edges (threshold={params.min_similarity})")
+@functools.lru_cache(maxsize=64)
+def _load_cached_layer(
+    model_id: str,
+    layer: int,
+    cache_dir: str,
+) -> Tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Load cached positions/edges for a layer, memoized per process.
 
-    return edges
+    Long-running callers (interactive servers, multi-layer exports) hit
+    the same layer repeatedly; the LRU avoids re-reading and re-decoding
+    the cache files each time. Callers must treat the returned arrays as
+    read-only since they are shared across calls.
+    """
+    cache_path = Path(cache_dir) / model_id / f"layer_{layer}"
+    positions = np.load(cache_path / "positions.npy").astype(np.float32)
+    with np.load(cache_path / "edges.npz") as data:
+        edges = {
+            "source": data["source"],
+            "target": data["target"],
+            "weight": data["weight"].astype(np.float32),
+        }
+    return positions, edges
 
 
 def compute_layer_positions(
@@ -183,7 +609,7 @@ def compute_layer_positions(
     umap_params: Optional[UMAPParams] = None,
     edge_params: Optional[EdgeParams] = None,
     force_recompute: bool = False,
-) -> Tuple[np.ndarray, list[dict]]:
+) -> Tuple[np.ndarray, dict[str, np.ndarray]]:
     """
     Compute positions and edges for a single layer.
 
@@ -202,13 +628,11 @@ def compute_layer_positions(
 
     # Check for cached positions
     positions_path = cache_path / "positions.npy"
-    edges_path = cache_path / "edges.npy"
+    edges_path = cache_path / "edges.npz"
 
     if not force_recompute and positions_path.exists() and edges_path.exists():
         print(f"Loading cached positions from {positions_path}")
-        positions = np.load(positions_path)
-        edges = np.load(edges_path, allow_pickle=True).tolist()
-        return positions, edges
+        return _load_cached_layer(model_id, layer, cache_dir)
 
     # Load decoder vectors
     vectors_path = cache_path / "decoder_vectors.npy"
@@ -218,31 +642,205 @@ def compute_layer_positions(
         )
 
     print(f"Loading decoder vectors from {vectors_path}")
-    decoder_vectors = np.load(vectors_path)
+    # mmap the cached file so repeated runs are served from the OS page
+    # cache; the fp32 cast below materializes the one copy we work on
+    decoder_vectors = np.ascontiguousarray(
+        np.load(vectors_path, mmap_mode="r"), dtype=np.float32
+    )
+
+    if umap_params is None:
+        umap_params = DEFAULT_UMAP_PARAMS
+    if edge_params is None:
+        edge_params = DEFAULT_EDGE_PARAMS
+
+    # Build the cosine kNN graph once; UMAP (n_neighbors) and edges
+    # (top_k + 1) both consume prefixes of the same neighbor graph
+    knn = None
+    if not (umap_params.use_gpu or edge_params.use_gpu):
+        k_shared = max(umap_params.n_neighbors, edge_params.top_k + 1)
+        knn = load_or_compute_knn(
+            decoder_vectors, k_shared, cache_path, random_state=umap_params.random_state
+        )
 
     # Compute UMAP positions
-    positions = compute_umap_positions(decoder_vectors, umap_params)
+    positions = compute_umap_positions(decoder_vectors, umap_params, precomputed_knn=knn)
 
     # Normalize to target range
     output_config = DEFAULT_OUTPUT_CONFIG
     positions = normalize_positions(positions, output_config.position_range)
 
     # Compute edges
-    edges = compute_edges(decoder_vectors, positions, edge_params)
-
-    # Cache results
-    np.save(positions_path, positions)
-    np.save(edges_path, np.array(edges, dtype=object))
+    edges = compute_edges(decoder_vectors, positions, edge_params, precomputed_knn=knn)
+
+    # Cache results. Positions are visualization coordinates in a +-50
+    # range and edge weights get rounded to 4 decimals on export, so fp16
+    # storage loses nothing visible while shrinking the cache ~4x.
+    np.save(positions_path, positions.astype(np.float16))
+    # Bounds sidecar: exports reuse these instead of re-reducing the
+    # positions on every (force) re-export
+    np.save(cache_path / "bounds.npy", compute_bounds_array(positions))
+    np.savez_compressed(
+        edges_path,
+        source=edges["source"],
+        target=edges["target"],
+        weight=edges["weight"].astype(np.float16),
+    )
+    # Drop any stale in-memory copy of the files we just rewrote
+    _load_cached_layer.cache_clear()
     print(f"Cached positions to {positions_path}")
 
     return positions, edges
 
 
+def _limit_worker_threads(n_threads: int) -> None:
+    """
+    Pool initializer: cap per-worker compute threads.
+
+    Without this, n_workers concurrent UMAP/BLAS/numba runs each spawn
+    cpu_count() threads and oversubscribe the machine. The *_NUM_THREADS
+    env vars are read once at library import time - by the time a forked
+    worker runs this initializer the pools are already sized - so the cap
+    has to go through the runtime APIs instead: numba for the
+    @njit(parallel=True) kernels, threadpoolctl for the BLAS/OpenMP pools,
+    and faiss's own OpenMP knob.
+    """
+    # numba rejects values above its launch-time maximum (affinity-bound)
+    set_num_threads(min(n_threads, numba_config.NUMBA_NUM_THREADS))
+    threadpool_limits(limits=n_threads)
+    if HAS_FAISS:
+        faiss.omp_set_num_threads(n_threads)
+
+
+def _layer_worker(
+    model_id: str,
+    layer: int,
+    cache_dir: str,
+    n_jobs: int,
+    force_recompute: bool,
+) -> Tuple[int, int]:
+    """Process-pool worker: compute one layer, return (layer, edge count)."""
+    umap_params = UMAPParams(n_jobs=n_jobs)
+    _, edges = compute_layer_positions(
+        model_id, layer, cache_dir,
+        umap_params=umap_params,
+        force_recompute=force_recompute,
+    )
+    return layer, int(edges["source"].size)
+
+
+def compute_all_layers(
+    model_id: str,
+    layers: Optional[list[int]] = None,
+    cache_dir: str = "./cache",
+    n_workers: int = 1,
+    force_recompute: bool = False,
+) -> dict[int, int]:
+    """
+    Compute positions and edges for multiple layers, optionally in parallel.
+
+    Layers are fully independent, so they are distributed across a process
+    pool. Each worker's compute threads (UMAP n_jobs plus the BLAS/OpenMP/
+    numba pools, via the pool initializer) are capped at
+    cpu_count() // n_workers to avoid oversubscription.
+
+    Args:
+        model_id: Model identifier
+        layers: Specific layers to process, or None for all
+        cache_dir: Directory with cached decoder vectors
+        n_workers: Number of worker processes (1 = sequential)
+        force_recompute: Ignore cached results
+
+    Returns:
+        Dict mapping layer number to edge count for successful layers
+    """
+    model_config = MODELS.get(model_id)
+    if not model_config:
+        raise ValueError(f"Unknown model: {model_id}")
+
+    if layers is None:
+        layers = list(range(model_config.num_layers))
+
+    results = {}
+
+    if n_workers <= 1:
+        for layer in layers:
+            try:
+                layer, num_edges = _layer_worker(
+                    model_id, layer, cache_dir, -1, force_recompute
+                )
+                results[layer] = num_edges
+            except Exception as e:
+                print(f"Error computing layer {layer}: {e}")
+        return results
+
+    n_jobs = max(1, (os.cpu_count() or 1) // n_workers)
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_limit_worker_threads,
+        initargs=(n_jobs,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _layer_worker, model_id, layer, cache_dir, n_jobs, force_recompute
+            ): layer
+            for layer in layers
+        }
+        for future in as_completed(futures):
+            layer = futures[future]
+            try:
+                _, num_edges = future.result()
+                results[layer] = num_edges
+                print(f"Layer {layer} done ({num_edges} edges)")
+            except Exception as e:
+                print(f"Error computing layer {layer}: {e}")
+
+    return results
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _minmax3(positions):
+    """
+    Fused per-column min/max over an (N, 3) array in one pass.
+
+    positions.min(axis=0) + positions.max(axis=0) walks the array twice;
+    this touches each element once, with per-thread partial reductions
+    combined at the end.
+    """
+    n = positions.shape[0]
+    # Scalar min/max reductions: numba recognizes these across prange
+    # threads (array-element updates would race)
+    mn0 = np.inf
+    mn1 = np.inf
+    mn2 = np.inf
+    mx0 = -np.inf
+    mx1 = -np.inf
+    mx2 = -np.inf
+    for i in prange(n):
+        mn0 = min(mn0, positions[i, 0])
+        mn1 = min(mn1, positions[i, 1])
+        mn2 = min(mn2, positions[i, 2])
+        mx0 = max(mx0, positions[i, 0])
+        mx1 = max(mx1, positions[i, 1])
+        mx2 = max(mx2, positions[i, 2])
+    return (
+        np.array([mn0, mn1, mn2], dtype=np.float32),
+        np.array([mx0, mx1, mx2], dtype=np.float32),
+    )
+
+
+def compute_bounds_array(positions: np.ndarray) -> np.ndarray:
+    """Bounding box as a (2, 3) float32 array: row 0 = min, row 1 = max."""
+    mn, mx = _minmax3(np.ascontiguousarray(positions, dtype=np.float32))
+    return np.stack([mn, mx])
+
+
 def compute_bounds(positions: np.ndarray) -> dict:
     """Compute bounding box for positions."""
+    bounds = compute_bounds_array(positions)
     return {
-        "min": positions.min(axis=0).tolist(),
-        "max": positions.max(axis=0).tolist(),
+        "min": bounds[0].tolist(),
+        "max": bounds[1].tolist(),
     }
 
 
@@ -255,30 +853,58 @@ if __name__ == "__main__":
                         help="Model ID")
     parser.add_argument("--layer", type=int, default=12,
                         help="Layer number")
+    parser.add_argument("--layers", type=str, default=None,
+                        help="Multiple layers, e.g. '0-5' or '0,5,12' (overrides --layer)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for --layers")
     parser.add_argument("--cache", type=str, default="./cache",
                         help="Cache directory")
     parser.add_argument("--force", action="store_true",
                         help="Force recompute even if cached")
+    parser.add_argument("--gpu", action="store_true",
+                        help="Use cuML GPU acceleration (requires cuml-cu12)")
 
     args = parser.parse_args()
 
+    if args.layers:
+        layers = []
+        for part in args.layers.split(","):
+            if "-" in part:
+                lo, hi = part.split("-")
+                layers.extend(range(int(lo), int(hi) + 1))
+            else:
+                layers.append(int(part))
+
+        start = time.time()
+        results = compute_all_layers(
+            args.model, layers, args.cache,
+            n_workers=args.workers,
+            force_recompute=args.force,
+        )
+        elapsed = time.time() - start
+
+        print(f"\n=== Computed {len(results)}/{len(layers)} layers in {elapsed:.1f}s ===")
+        raise SystemExit(0 if len(results) == len(layers) else 1)
+
     start = time.time()
     positions, edges = compute_layer_positions(
         args.model,
         args.layer,
         args.cache,
+        umap_params=UMAPParams(use_gpu=args.gpu),
+        edge_params=EdgeParams(use_gpu=args.gpu),
         force_recompute=args.force,
     )
     elapsed = time.time() - start
 
     print(f"\n=== Results for {args.model} layer {args.layer} ===")
     print(f"Positions shape: {positions.shape}")
-    print(f"Number of edges: {len(edges)}")
+    print(f"Number of edges: {edges['source'].size}")
     print(f"Position bounds: {compute_bounds(positions)}")
     print(f"Computation time: {elapsed:.1f}s ({elapsed/60:.1f}m)")
 
     # Sample statistics
-    if len(edges) > 0:
-        weights = [e["weight"] for e in edges]
-        print(f"Edge weight range: [{min(weights):.3f}, {max(weights):.3f}]")
-        print(f"Mean edge weight: {np.mean(weights):.3f}")
+    if edges["source"].size > 0:
+        weights = edges["weight"]
+        print(f"Edge weight range: [{weights.min():.3f}, {weights.max():.3f}]")
+        print(f"Mean edge weight: {weights.mean():.3f}")
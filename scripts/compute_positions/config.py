@@ -85,6 +85,7 @@ class UMAPParams:
     # Performance tuning
     n_jobs: int = -1             # Use all CPU cores
     low_memory: bool = False     # Trade memory for speed
+    use_gpu: bool = False        # Use cuML UMAP (requires cuml-cu12)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -112,6 +113,7 @@ class EdgeParams:
     top_k: int = 25              # Top-K neighbors per feature
     min_similarity: float = 0.25  # Minimum cosine similarity threshold
     deduplicate: bool = True      # Remove bidirectional duplicates
+    use_gpu: bool = False         # Use cuML kNN (requires cuml-cu12)
 
 
 DEFAULT_EDGE_PARAMS = EdgeParams()
@@ -166,15 +168,42 @@ class OutputConfig:
     # Position normalization
     position_range: tuple = (-50.0, 50.0)  # Normalize to this range
 
-    # Compression
-    compress: bool = True        # gzip output
+    # Compression. zstd at level 3 compresses 3-5x faster than gzip and
+    # ~10-20% smaller, but requires a zstd decoder on the consumer side -
+    # gzip stays the default until the frontend ships one.
+    compress: bool = True
+    codec: str = "gzip"          # "gzip" or "zstd" (requires zstandard)
+
+    # Serialization format. msgpack encodes floats as fixed-width binary
+    # instead of decimal strings and skips float parsing on the consumer
+    # side, but the frontend needs a msgpack decoder.
+    format: str = "json"         # "json" or "msgpack" (requires msgpack)
+
+    # Pretty-print JSON (debugging only - roughly doubles bytes and
+    # serialization time; output is machine-consumed)
+    pretty: bool = False
+
+    # Also emit edges as packed binary records (zero-parse consumption)
+    edges_binary: bool = False
+
+    # Ship positions as one base64 float32 blob instead of per-node
+    # [x, y, z] arrays: one base64 decode + Float32Array view on the
+    # frontend instead of parsing ~48k JSON floats. Off by default -
+    # the current frontend schema requires position on each node.
+    positions_blob: bool = False
 
     # File naming
     def get_layer_filename(self, model_id: str, layer: int) -> str:
         """Get filename for a layer's position data."""
-        ext = ".json.gz" if self.compress else ".json"
+        ext = ".msgpack" if self.format == "msgpack" else ".json"
+        if self.compress:
+            ext += ".zst" if self.codec == "zstd" else ".gz"
         return f"layer-{layer:02d}{ext}"
 
+    def get_edges_binary_filename(self, model_id: str, layer: int) -> str:
+        """Get filename for a layer's binary edge records."""
+        return f"layer-{layer:02d}.edges.bin"
+
     def get_manifest_filename(self) -> str:
         """Get manifest filename."""
         return "manifest.json"
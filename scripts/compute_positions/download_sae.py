@@ -101,7 +101,9 @@ def download_decoder_vectors(
     cached_path = cache_dir / "decoder_vectors.npy"
     if cached_path.exists():
         print(f"Loading cached decoder vectors from {cached_path}")
-        return np.load(cached_path)
+        # Read-only mmap: pages are faulted in on demand and shared with
+        # any other process reading the same cache file
+        return np.load(cached_path, mmap_mode="r")
 
     print(f"Downloading SAE weights for {model_id} layer {layer}...")
 
@@ -148,12 +150,18 @@ def download_decoder_vectors(
     # L2 normalize vectors (makes cosine similarity = dot product)
     if normalize:
         print("L2-normalizing decoder vectors...")
-        norms = np.linalg.norm(decoder_vectors, axis=1, keepdims=True)
+        # BLAS-backed squared norms in one einsum pass, then sqrt / clamp /
+        # divide in place - no full-size (num_features, d_model) temporaries
+        decoder_vectors = np.ascontiguousarray(decoder_vectors, dtype=np.float32)
+        norms = np.einsum("ij,ij->i", decoder_vectors, decoder_vectors)
+        np.sqrt(norms, out=norms)
         # Avoid division by zero for dead features
-        norms = np.maximum(norms, 1e-8)
-        decoder_vectors = decoder_vectors / norms
+        np.maximum(norms, 1e-8, out=norms)
+        decoder_vectors /= norms[:, None]
 
-    # Cache for future use
+    # Cache for future use. fp16 halves the on-disk footprint and load I/O;
+    # the compute path upcasts to fp32, which preserves cosine-kNN quality.
+    decoder_vectors = decoder_vectors.astype(np.float16)
     np.save(cached_path, decoder_vectors)
     print(f"Cached decoder vectors to {cached_path}")
 
@@ -7,7 +7,10 @@ that the frontend can consume. Outputs gzipped JSON for efficient transfer.
 This is the bridge between Python computation and TypeScript consumption.
 """
 
+import base64
+import functools
 import gzip
+import hashlib
 import json
 import numpy as np
 from pathlib import Path
@@ -20,6 +23,18 @@ try:
 except ImportError:
     USE_ORJSON = False
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 from config import (
     MODELS,
     DEFAULT_UMAP_PARAMS,
@@ -27,18 +42,22 @@ from config import (
     OutputConfig,
     PIPELINE_VERSION,
 )
+from fetch_labels import load_labels_cache
 
 
 def load_cached_data(
     model_id: str,
     layer: int,
     cache_dir: str = "./cache",
-) -> tuple[np.ndarray, list[dict], dict[int, str]]:
+) -> tuple[np.ndarray, dict[str, np.ndarray], dict[int, str], Optional[np.ndarray]]:
     """
     Load all cached data for a layer.
 
     Returns:
-        Tuple of (positions, edges, labels)
+        Tuple of (positions, edges, labels, bounds). Edges are parallel
+        arrays {source: int32, target: int32, weight: float32}; bounds is
+        the (2, 3) min/max sidecar written at compute time, or None for
+        older caches.
     """
     cache_path = Path(cache_dir) / model_id / f"layer_{layer}"
 
@@ -46,39 +65,113 @@ def load_cached_data(
     positions_path = cache_path / "positions.npy"
     if not positions_path.exists():
         raise FileNotFoundError(f"Positions not found at {positions_path}")
-    positions = np.load(positions_path)
+    positions = np.load(positions_path).astype(np.float32)
 
     # Load edges
-    edges_path = cache_path / "edges.npy"
+    edges_path = cache_path / "edges.npz"
+    legacy_edges_path = cache_path / "edges.npy"
     if edges_path.exists():
-        edges = np.load(edges_path, allow_pickle=True).tolist()
-    else:
-        edges = []
-
-    # Load labels (optional)
-    labels_path = cache_path / "labels.json"
-    if labels_path.exists():
-        with open(labels_path, "r") as f:
-            labels_raw = json.load(f)
-            # Convert string keys back to int
-            labels = {int(k): v for k, v in labels_raw.items()}
+        with np.load(edges_path) as data:
+            edges = {
+                "source": data["source"],
+                "target": data["target"],
+                "weight": data["weight"].astype(np.float32),
+            }
+    elif legacy_edges_path.exists():
+        # Pre-SoA cache: pickled list of {source, target, weight} dicts.
+        # Convert once so the rest of the export stays columnar.
+        edge_dicts = np.load(legacy_edges_path, allow_pickle=True).tolist()
+        edges = {
+            "source": np.array([e["source"] for e in edge_dicts], dtype=np.int32),
+            "target": np.array([e["target"] for e in edge_dicts], dtype=np.int32),
+            "weight": np.array([e["weight"] for e in edge_dicts], dtype=np.float32),
+        }
     else:
-        labels = {}
+        edges = {
+            "source": np.array([], dtype=np.int32),
+            "target": np.array([], dtype=np.int32),
+            "weight": np.array([], dtype=np.float32),
+        }
+
+    # Load labels (optional); fetch_labels owns the cache formats
+    # (pooled zstd, legacy pairs, legacy labels.json)
+    labels = load_labels_cache(cache_path) or {}
 
-    return positions, edges, labels
+    # Load bounds sidecar (optional; computed from positions if absent)
+    bounds_path = cache_path / "bounds.npy"
+    bounds = np.load(bounds_path) if bounds_path.exists() else None
+
+    return positions, edges, labels, bounds
+
+
+def _inputs_fingerprint(
+    positions: np.ndarray,
+    edges: dict[str, np.ndarray],
+    labels: dict[int, str],
+    output_config: OutputConfig,
+) -> str:
+    """
+    Hash everything that determines the serialized output.
+
+    Covers the cached arrays, the labels, and the output-shaping config
+    (format/codec/blob flags), plus the pipeline version. BLAKE2 runs at
+    ~1 GB/s, so hashing is orders of magnitude cheaper than serializing.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(positions).tobytes())
+    for key in ("source", "target", "weight"):
+        h.update(np.ascontiguousarray(edges[key]).tobytes())
+    h.update(json.dumps(sorted(labels.items()), separators=(",", ":")).encode("utf-8"))
+    h.update(
+        f"{PIPELINE_VERSION}|{output_config.format}|{output_config.codec}|"
+        f"{output_config.compress}|{output_config.pretty}|"
+        f"{output_config.positions_blob}|{output_config.edges_binary}".encode("ascii")
+    )
+    return h.hexdigest()
+
+
+# Reused per-process scratch for rounded positions; exports run one layer
+# at a time per process, and the buffer is fully consumed (serialized)
+# before the next export overwrites it
+_pos_scratch: Optional[np.ndarray] = None
+
+
+def _round_positions(positions: np.ndarray) -> np.ndarray:
+    """Round positions to 4 decimals into a reused float32 scratch buffer."""
+    global _pos_scratch
+    if _pos_scratch is None or _pos_scratch.shape != positions.shape:
+        _pos_scratch = np.empty(positions.shape, dtype=np.float32)
+    np.round(positions, 4, out=_pos_scratch)
+    return _pos_scratch
+
+
+@functools.lru_cache(maxsize=8)
+def _id_strings(model_id: str, layer: int, n: int) -> tuple[str, ...]:
+    """
+    Node ID strings for a layer, memoized.
+
+    IDs depend only on (model_id, layer, n), so re-exports of the same
+    layer (force_reexport reruns, layer + manifest export in one process)
+    reuse the interned strings instead of re-formatting 16k of them.
+    """
+    return tuple(f"{model_id}:{layer}:{idx}" for idx in range(n))
 
 
 def build_layer_json(
     model_id: str,
     layer: int,
     positions: np.ndarray,
-    edges: list[dict],
+    edges: dict[str, np.ndarray],
     labels: dict[int, str],
+    bounds: Optional[np.ndarray] = None,
+    positions_blob: bool = False,
 ) -> dict:
     """
     Build the JSON structure for a layer.
 
-    Matches the GraphJSONSchema expected by the frontend.
+    Matches the GraphJSONSchema expected by the frontend. With
+    positions_blob, per-node position arrays are replaced by one
+    top-level base64 float32 buffer indexed by node order.
     """
     model_config = MODELS.get(model_id)
     if not model_config:
@@ -87,43 +180,74 @@ def build_layer_json(
     source_id = model_config.get_source_id(layer)
     num_features = positions.shape[0]
 
-    # Compute bounds
-    bounds_min = positions.min(axis=0).tolist()
-    bounds_max = positions.max(axis=0).tolist()
-
-    # Build nodes array
-    nodes = []
-    for idx in range(num_features):
-        node = {
-            "id": f"{model_id}:{layer}:{idx}",
-            "featureId": {
-                "modelId": model_id,
-                "layer": layer,
-                "index": idx,
-            },
-            "position": [
-                round(float(positions[idx, 0]), 4),
-                round(float(positions[idx, 1]), 4),
-                round(float(positions[idx, 2]), 4),
-            ],
-        }
-
-        # Add label if available
-        if idx in labels:
-            node["label"] = labels[idx]
-
-        nodes.append(node)
-
-    # Build edges array with IDs
-    edges_with_ids = []
-    for i, edge in enumerate(edges):
-        edges_with_ids.append({
-            "id": f"edge-{layer}-{i}",
-            "source": f"{model_id}:{layer}:{edge['source']}",
-            "target": f"{model_id}:{layer}:{edge['target']}",
-            "weight": round(float(edge["weight"]), 4),
+    # Bounds come from the compute-time sidecar when available; only
+    # older caches pay for the reduction here
+    if bounds is None:
+        bounds = np.stack([positions.min(axis=0), positions.max(axis=0)])
+    bounds_min = bounds[0].tolist()
+    bounds_max = bounds[1].tolist()
+
+    # Round positions once, vectorized, into the reused scratch buffer -
+    # no fresh (N, 3) allocation per export. orjson serializes the ndarray
+    # rows straight from the C buffer (OPT_SERIALIZE_NUMPY); the stdlib
+    # fallback needs plain lists.
+    pos_rounded = _round_positions(positions)
+    pos_rows = pos_rounded if USE_ORJSON else pos_rounded.tolist()
+    node_ids = _id_strings(model_id, layer, num_features)
+
+    # Build nodes array as a single comprehension - specialized LIST_APPEND
+    # bytecode, no per-iteration labels.get() for the ~94% unlabeled nodes.
+    # The sparse labels are patched in afterwards.
+    if positions_blob:
+        nodes = [
+            {
+                "id": node_ids[idx],
+                "featureId": {
+                    "modelId": model_id,
+                    "layer": layer,
+                    "index": idx,
+                },
+            }
+            for idx in range(num_features)
+        ]
+    else:
+        nodes = [
+            {
+                "id": node_ids[idx],
+                "featureId": {
+                    "modelId": model_id,
+                    "layer": layer,
+                    "index": idx,
+                },
+                "position": pos_rows[idx],
+            }
+            for idx in range(num_features)
+        ]
+
+    for idx, label in labels.items():
+        if 0 <= idx < num_features:
+            nodes[idx]["label"] = label
+
+    # Build edges array with IDs. Endpoint strings come from the memoized
+    # node-ID table rather than re-formatting per edge.
+    edge_id_prefix = f"edge-{layer}-"
+    # Round all weights in one vectorized pass; orjson serializes the
+    # numpy scalars straight from the array (OPT_SERIALIZE_NUMPY), the
+    # stdlib fallback needs Python floats
+    weights_rounded = np.round(edges["weight"], 4)
+    weight_vals = weights_rounded if USE_ORJSON else weights_rounded.tolist()
+    edges_with_ids = [
+        {
+            "id": edge_id_prefix + str(i),
+            "source": node_ids[source],
+            "target": node_ids[target],
+            "weight": weight,
             "type": "coactivation",
-        })
+        }
+        for i, (source, target, weight) in enumerate(
+            zip(edges["source"].tolist(), edges["target"].tolist(), weight_vals)
+        )
+    ]
 
     # Build final structure
     result = {
@@ -146,9 +270,102 @@ def build_layer_json(
         "edges": edges_with_ids,
     }
 
+    if positions_blob:
+        # Full-precision little-endian float32, node-order rows; the
+        # frontend views the decoded buffer as a Float32Array
+        result["positionsBlob"] = base64.b64encode(
+            np.ascontiguousarray(positions, dtype="<f4").tobytes()
+        ).decode("ascii")
+
     return result
 
 
+def _dump_json_chunk(obj) -> bytes:
+    """Serialize one object compactly (orjson when available)."""
+    if USE_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_layer_json(layer_data: dict, fileobj, chunk_size: int = 1000) -> None:
+    """
+    Stream a layer's JSON into fileobj in node/edge chunks.
+
+    Serializing the whole payload as a single bytes object holds tens of
+    MB in RAM on top of the dict itself. Writing the metadata followed by
+    chunk_size-element slices of nodes and edges keeps the in-flight
+    buffer to one chunk and overlaps gzip compression with serialization.
+    """
+    fileobj.write(b'{"metadata":')
+    fileobj.write(_dump_json_chunk(layer_data["metadata"]))
+
+    if "positionsBlob" in layer_data:
+        fileobj.write(b',"positionsBlob":')
+        fileobj.write(_dump_json_chunk(layer_data["positionsBlob"]))
+
+    for key in ("nodes", "edges"):
+        items = layer_data[key]
+        fileobj.write(b',"' + key.encode("ascii") + b'":[')
+        for start in range(0, len(items), chunk_size):
+            if start > 0:
+                fileobj.write(b",")
+            chunk = _dump_json_chunk(items[start:start + chunk_size])
+            fileobj.write(chunk[1:-1])  # strip the chunk's own brackets
+        fileobj.write(b"]")
+
+    fileobj.write(b"}\n")
+
+
+def _msgpack_default(obj):
+    """msgpack fallback for numpy values (position rows, scalars)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize {type(obj)!r} to msgpack")
+
+
+def _open_compressed(output_path: Path, output_config: OutputConfig):
+    """
+    Open the output file for writing, wrapped in the configured codec.
+
+    zstd (level 3, multithreaded) compresses several times faster than
+    gzip and slightly smaller, but the consumer needs a zstd decoder.
+    """
+    if not output_config.compress:
+        return open(output_path, "wb")
+    if output_config.codec == "zstd":
+        if not HAS_ZSTD:
+            raise ImportError(
+                "codec='zstd' requires the zstandard package (pip install zstandard)"
+            )
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        return cctx.stream_writer(open(output_path, "wb"), closefd=True)
+    return gzip.open(output_path, "wb")
+
+
+def export_edges_binary(
+    edges: dict[str, np.ndarray],
+    output_path: Path,
+) -> Path:
+    """
+    Write edges as packed little-endian (int32, int32, float32) records.
+
+    Consumers can mmap the file or view it directly as typed arrays
+    (e.g. Int32Array/Float32Array over the same buffer) with zero parsing,
+    instead of walking the JSON edge list.
+    """
+    records = np.empty(
+        edges["source"].size,
+        dtype=np.dtype([("source", "<i4"), ("target", "<i4"), ("weight", "<f4")]),
+    )
+    records["source"] = edges["source"]
+    records["target"] = edges["target"]
+    records["weight"] = edges["weight"]
+    records.tofile(output_path)
+    return output_path
+
+
 def export_layer(
     model_id: str,
     layer: int,
@@ -184,31 +401,70 @@ def export_layer(
         print(f"Output already exists: {output_path}")
         return output_path
 
-    print(f"Exporting {model_id} layer {layer}...")
-
     # Load cached data
-    positions, edges, labels = load_cached_data(model_id, layer, cache_dir)
+    positions, edges, labels, bounds = load_cached_data(model_id, layer, cache_dir)
+
+    # Even under force_reexport, skip serialization when the inputs that
+    # produced the existing output are unchanged (hash sidecar)
+    hash_path = output_path.with_name(output_path.name + ".hash")
+    fingerprint = _inputs_fingerprint(positions, edges, labels, output_config)
+    up_to_date = (
+        output_path.exists()
+        and hash_path.exists()
+        and hash_path.read_text().strip() == fingerprint
+    )
+    if up_to_date and output_config.edges_binary:
+        # The binary edge file is part of the output too - an earlier
+        # export without the flag must not satisfy the skip
+        binary_path = output_dir / output_config.get_edges_binary_filename(model_id, layer)
+        up_to_date = binary_path.exists()
+    if up_to_date:
+        print(f"Inputs unchanged, keeping {output_path}")
+        return output_path
 
+    print(f"Exporting {model_id} layer {layer}...")
     print(f"  Positions: {positions.shape}")
-    print(f"  Edges: {len(edges)}")
+    print(f"  Edges: {edges['source'].size}")
     print(f"  Labels: {len(labels)}")
 
     # Build JSON structure
-    layer_data = build_layer_json(model_id, layer, positions, edges, labels)
-
-    # Serialize
-    if USE_ORJSON:
-        json_bytes = orjson.dumps(layer_data, option=orjson.OPT_INDENT_2)
-    else:
-        json_bytes = json.dumps(layer_data, indent=2).encode("utf-8")
+    layer_data = build_layer_json(
+        model_id, layer, positions, edges, labels, bounds,
+        positions_blob=output_config.positions_blob,
+    )
 
-    # Write (with optional compression)
-    if output_config.compress:
-        with gzip.open(output_path, "wb") as f:
-            f.write(json_bytes)
-    else:
-        with open(output_path, "wb") as f:
-            f.write(json_bytes)
+    # Serialize + write. The default path streams compact JSON into the
+    # (optionally compressed) file in chunks; pretty mode is a debugging
+    # path and keeps the simple single-buffer dump.
+    with _open_compressed(output_path, output_config) as f:
+        if output_config.format == "msgpack":
+            if not HAS_MSGPACK:
+                raise ImportError(
+                    "format='msgpack' requires the msgpack package (pip install msgpack)"
+                )
+            # use_single_float: positions/weights are rounded to 4
+            # decimals anyway, float32 halves the encoded size
+            f.write(msgpack.packb(
+                layer_data, use_single_float=True, default=_msgpack_default
+            ))
+        elif output_config.pretty:
+            if USE_ORJSON:
+                f.write(orjson.dumps(
+                    layer_data,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+                ))
+            else:
+                f.write(json.dumps(layer_data, indent=2).encode("utf-8"))
+        else:
+            _write_layer_json(layer_data, f)
+
+    hash_path.write_text(fingerprint + "\n")
+
+    # Optional binary edge records for zero-parse consumers
+    if output_config.edges_binary:
+        binary_path = output_dir / output_config.get_edges_binary_filename(model_id, layer)
+        export_edges_binary(edges, binary_path)
+        print(f"  Binary edges: {binary_path}")
 
     # Report size
     file_size = output_path.stat().st_size
@@ -273,12 +529,18 @@ def export_manifest(
     manifest_path = output_dir / output_config.get_manifest_filename()
 
     if USE_ORJSON:
-        json_bytes = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        option = orjson.OPT_APPEND_NEWLINE
+        if output_config.pretty:
+            option |= orjson.OPT_INDENT_2
+        json_bytes = orjson.dumps(manifest, option=option)
         with open(manifest_path, "wb") as f:
             f.write(json_bytes)
     else:
         with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+            if output_config.pretty:
+                json.dump(manifest, f, indent=2)
+            else:
+                json.dump(manifest, f, separators=(",", ":"))
 
     print(f"Manifest exported to: {manifest_path}")
     return manifest_path
@@ -297,7 +559,19 @@ if __name__ == "__main__":
     parser.add_argument("--output", type=str, default="./output",
                         help="Output directory")
     parser.add_argument("--no-compress", action="store_true",
-                        help="Disable gzip compression")
+                        help="Disable compression")
+    parser.add_argument("--codec", type=str, default="gzip",
+                        choices=["gzip", "zstd"],
+                        help="Compression codec (zstd requires zstandard)")
+    parser.add_argument("--format", type=str, default="json",
+                        choices=["json", "msgpack"],
+                        help="Serialization format (msgpack requires msgpack)")
+    parser.add_argument("--edges-binary", action="store_true",
+                        help="Also emit packed binary edge records")
+    parser.add_argument("--positions-blob", action="store_true",
+                        help="Ship positions as one base64 float32 blob")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Pretty-print JSON (debugging)")
     parser.add_argument("--force", action="store_true",
                         help="Force re-export even if exists")
 
@@ -306,6 +580,11 @@ if __name__ == "__main__":
     output_config = OutputConfig(
         output_dir=args.output,
         compress=not args.no_compress,
+        codec=args.codec,
+        format=args.format,
+        edges_binary=args.edges_binary,
+        positions_blob=args.positions_blob,
+        pretty=args.pretty,
     )
 
     output_path = export_layer(
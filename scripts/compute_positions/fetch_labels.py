@@ -11,11 +11,32 @@ Labels provide semantic meaning to the spatial positions computed by UMAP.
 import asyncio
 import aiohttp
 import json
+import sys
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from tqdm.asyncio import tqdm as atqdm
 
+try:
+    import h2  # noqa: F401 - httpx's http2 extra
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 from config import MODELS, DEFAULT_NEURONPEDIA_CONFIG, NeuronpediaConfig
 
 
@@ -30,28 +51,87 @@ class NeuronpediaClient:
         self.retry_attempts = self.config.retry_attempts
         self.retry_delay = self.config.retry_delay
 
-        # Rate limiting state
-        self._request_times: list[float] = []
+        # Rate limiting state. Timestamps use time.monotonic() so
+        # wall-clock jumps (NTP adjustments) cannot distort the window.
+        self._request_times: deque[float] = deque()
         self._lock = asyncio.Lock()
 
+    def _evict_expired(self, now: float) -> None:
+        """Drop timestamps older than the 60s window - O(evicted), no realloc."""
+        times = self._request_times
+        while times and now - times[0] >= 60.0:
+            times.popleft()
+
     async def _wait_for_rate_limit(self):
         """Wait if we're exceeding rate limits."""
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        # Fast path: under budget. Safe without the lock - there is no
+        # await between the check and the append, so no other coroutine
+        # can interleave.
+        if len(self._request_times) < self.rate_limit:
+            self._request_times.append(now)
+            return
+
         async with self._lock:
-            now = time.time()
-            # Remove requests older than 1 minute
-            self._request_times = [t for t in self._request_times if now - t < 60]
+            while True:
+                now = time.monotonic()
+                self._evict_expired(now)
+                if len(self._request_times) < self.rate_limit:
+                    self._request_times.append(now)
+                    return
+                # Sleep until the oldest request ages out of the window
+                await asyncio.sleep(60.0 - (now - self._request_times[0]) + 0.1)
+
+    def _make_session(self, concurrency: int):
+        """
+        Create the HTTP session for a batch of fetches.
 
-            if len(self._request_times) >= self.rate_limit:
-                # Wait until the oldest request is 1 minute old
-                sleep_time = 60 - (now - self._request_times[0]) + 0.1
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+        With httpx installed, a single HTTP/2 connection multiplexes all
+        concurrent requests as streams - no per-request TLS handshake or
+        connection setup across thousands of feature fetches. Falls back
+        to an aiohttp connection pool otherwise.
+        """
+        if HAS_HTTPX:
+            return httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=concurrency,
+                    max_keepalive_connections=concurrency,
+                ),
+            )
+        return aiohttp.ClientSession()
+
+    async def _get(self, session, url: str, headers: dict) -> tuple[int, Optional[dict], str]:
+        """
+        Issue one GET; return (status, json or None, Retry-After).
 
-            self._request_times.append(time.time())
+        Bodies parse with orjson when available - feature responses carry
+        KBs of activation examples, and orjson parses them 2-3x faster
+        than the stdlib decoder both backends default to.
+        """
+        if HAS_HTTPX and isinstance(session, httpx.AsyncClient):
+            response = await session.get(url, headers=headers)
+            retry_after = response.headers.get("Retry-After", "60")
+            data = None
+            if response.status_code == 200:
+                data = (orjson.loads(response.content) if USE_ORJSON
+                        else response.json())
+            return response.status_code, data, retry_after
+
+        async with session.get(url, headers=headers) as response:
+            retry_after = response.headers.get("Retry-After", "60")
+            data = None
+            if response.status == 200:
+                data = await (response.json(loads=orjson.loads) if USE_ORJSON
+                              else response.json())
+            return response.status, data, retry_after
 
     async def fetch_feature(
         self,
-        session: aiohttp.ClientSession,
+        session,
         model_id: str,
         source_id: str,
         feature_index: int,
@@ -60,7 +140,7 @@ class NeuronpediaClient:
         Fetch a single feature from Neuronpedia.
 
         Args:
-            session: aiohttp session
+            session: httpx.AsyncClient or aiohttp.ClientSession
             model_id: e.g., "gemma-2-2b"
             source_id: e.g., "12-gemmascope-res-16k"
             feature_index: Feature index (0-16383)
@@ -78,19 +158,18 @@ class NeuronpediaClient:
 
         for attempt in range(self.retry_attempts):
             try:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 404:
-                        return None  # Feature not found
-                    elif response.status == 429:
-                        # Rate limited, wait and retry
-                        retry_after = response.headers.get("Retry-After", "60")
-                        await asyncio.sleep(int(retry_after))
-                    else:
-                        if attempt == self.retry_attempts - 1:
-                            return None
-                        await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                status, data, retry_after = await self._get(session, url, headers)
+                if status == 200:
+                    return data
+                elif status == 404:
+                    return None  # Feature not found
+                elif status == 429:
+                    # Rate limited, wait and retry
+                    await asyncio.sleep(int(retry_after))
+                else:
+                    if attempt == self.retry_attempts - 1:
+                        return None
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
             except Exception as e:
                 if attempt == self.retry_attempts - 1:
                     print(f"Error fetching feature {feature_index}: {e}")
@@ -126,21 +205,31 @@ class NeuronpediaClient:
         results = {}
 
         semaphore = asyncio.Semaphore(concurrency)
+        progress = atqdm(
+            total=len(feature_indices),
+            desc=f"Fetching labels for layer {layer}",
+        )
 
-        async def fetch_one(session: aiohttp.ClientSession, idx: int):
-            async with semaphore:
+        async def fetch_one(session, idx: int):
+            try:
                 data = await self.fetch_feature(session, model_id, source_id, idx)
                 if data:
                     results[idx] = data
-
-        async with aiohttp.ClientSession() as session:
-            tasks = [fetch_one(session, idx) for idx in feature_indices]
-            for task in atqdm(
-                asyncio.as_completed(tasks),
-                total=len(tasks),
-                desc=f"Fetching labels for layer {layer}",
-            ):
-                await task
+            finally:
+                progress.update(1)
+                semaphore.release()
+
+        try:
+            async with self._make_session(concurrency) as session:
+                async with asyncio.TaskGroup() as tg:
+                    for idx in feature_indices:
+                        # Acquire before spawning: at most `concurrency`
+                        # Task objects are alive at once, instead of
+                        # materializing 16k coroutine frames up front
+                        await semaphore.acquire()
+                        tg.create_task(fetch_one(session, idx))
+        finally:
+            progress.close()
 
         return results
 
@@ -168,6 +257,68 @@ def extract_label(feature_data: dict) -> Optional[str]:
     return None
 
 
+def load_labels_cache(layer_cache_dir: Path) -> Optional[dict[int, str]]:
+    """
+    Load a layer's cached labels, or None if not cached.
+
+    Prefers the compact zstd-compressed orjson cache (labels.json.zst,
+    stored as a string pool plus [index, pool_position] references),
+    falling back to the legacy pretty-printed labels.json. Strings are
+    sys.intern'd on load so duplicate labels (the "Top tokens: ..."
+    fallback repeats across features) share one object in memory.
+    """
+    zst_path = layer_cache_dir / "labels.json.zst"
+    if HAS_ZSTD and zst_path.exists():
+        raw = zstandard.ZstdDecompressor().decompress(zst_path.read_bytes())
+        data = orjson.loads(raw) if USE_ORJSON else json.loads(raw)
+        if isinstance(data, dict):
+            pool = [sys.intern(label) for label in data["pool"]]
+            return {idx: pool[pos] for idx, pos in data["ids"]}
+        # Earlier compressed caches stored flat [index, label] pairs
+        return {idx: sys.intern(label) for idx, label in data}
+
+    json_path = layer_cache_dir / "labels.json"
+    if json_path.exists():
+        with open(json_path, "r") as f:
+            cached = json.load(f)
+        # Convert string keys back to int
+        return {int(k): v for k, v in cached.items()}
+
+    return None
+
+
+def save_labels_cache(layer_cache_dir: Path, labels: dict[int, str]) -> Path:
+    """Persist a layer's labels; compressed when zstandard is available."""
+    layer_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if HAS_ZSTD:
+        # Deduplicate label strings into a pool; features reference pool
+        # positions. High-duplication layers (top-logits fallback labels)
+        # shrink severalfold before compression even sees them.
+        pool: list[str] = []
+        pool_positions: dict[str, int] = {}
+        ids = []
+        for idx, label in sorted(labels.items()):
+            pos = pool_positions.get(label)
+            if pos is None:
+                pos = len(pool)
+                pool_positions[label] = pos
+                pool.append(label)
+            ids.append((idx, pos))
+
+        pooled = {"pool": pool, "ids": ids}
+        payload = (orjson.dumps(pooled) if USE_ORJSON
+                   else json.dumps(pooled, separators=(",", ":")).encode("utf-8"))
+        cache_path = layer_cache_dir / "labels.json.zst"
+        cache_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(payload))
+        return cache_path
+
+    cache_path = layer_cache_dir / "labels.json"
+    with open(cache_path, "w") as f:
+        json.dump(labels, f, separators=(",", ":"))
+    return cache_path
+
+
 async def fetch_layer_labels(
     model_id: str,
     layer: int,
@@ -175,6 +326,7 @@ async def fetch_layer_labels(
     feature_indices: Optional[list[int]] = None,
     cache_dir: str = "./cache",
     force_refetch: bool = False,
+    config: Optional[NeuronpediaConfig] = None,
 ) -> dict[int, str]:
     """
     Fetch labels for a layer.
@@ -186,25 +338,27 @@ async def fetch_layer_labels(
         feature_indices: Specific indices to fetch (overrides top_k)
         cache_dir: Cache directory
         force_refetch: Ignore cache
+        config: API configuration (default: DEFAULT_NEURONPEDIA_CONFIG);
+            parallel callers pass a reduced per-worker rate budget here
 
     Returns:
         Dict mapping feature index to label string
     """
-    config = DEFAULT_NEURONPEDIA_CONFIG
+    if config is None:
+        config = DEFAULT_NEURONPEDIA_CONFIG
     config.validate()  # Ensure API key is set
 
     if top_k is None:
         top_k = config.top_k_labels
 
     # Check cache
-    cache_path = Path(cache_dir) / model_id / f"layer_{layer}" / "labels.json"
+    layer_cache_dir = Path(cache_dir) / model_id / f"layer_{layer}"
 
-    if not force_refetch and cache_path.exists():
-        print(f"Loading cached labels from {cache_path}")
-        with open(cache_path, "r") as f:
-            cached = json.load(f)
-            # Convert string keys back to int
-            return {int(k): v for k, v in cached.items()}
+    if not force_refetch:
+        cached = load_labels_cache(layer_cache_dir)
+        if cached is not None:
+            print(f"Loading cached labels from {layer_cache_dir}")
+            return cached
 
     # Determine which features to fetch
     if feature_indices is None:
@@ -220,7 +374,7 @@ async def fetch_layer_labels(
     print(f"Fetching {len(feature_indices)} labels for {model_id} layer {layer}...")
 
     # Fetch features
-    client = NeuronpediaClient()
+    client = NeuronpediaClient(config)
     feature_data = await client.fetch_features_batch(
         model_id, layer, feature_indices
     )
@@ -235,9 +389,7 @@ async def fetch_layer_labels(
     print(f"Got {len(labels)} labels out of {len(feature_indices)} requested")
 
     # Cache results
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w") as f:
-        json.dump(labels, f, indent=2)
+    cache_path = save_labels_cache(layer_cache_dir, labels)
     print(f"Cached labels to {cache_path}")
 
     return labels
@@ -13,14 +13,23 @@ Supports resumption - if a step fails, re-running will pick up where it left off
 
 import argparse
 import asyncio
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
-from config import MODELS, DEFAULT_OUTPUT_CONFIG, OutputConfig
+from config import (
+    MODELS,
+    DEFAULT_NEURONPEDIA_CONFIG,
+    DEFAULT_OUTPUT_CONFIG,
+    NeuronpediaConfig,
+    OutputConfig,
+    UMAPParams,
+)
 from download_sae import download_decoder_vectors
-from compute_umap import compute_layer_positions
+from compute_umap import compute_layer_positions, _limit_worker_threads
 from fetch_labels import fetch_layer_labels
 from export_layer import export_layer, export_manifest
 
@@ -34,6 +43,8 @@ def run_layer_pipeline(
     skip_labels: bool = False,
     force: bool = False,
     verbose: bool = True,
+    n_jobs: int = -1,
+    neuronpedia_config: Optional[NeuronpediaConfig] = None,
 ) -> bool:
     """
     Run the complete pipeline for a single layer.
@@ -47,6 +58,10 @@ def run_layer_pipeline(
         skip_labels: Skip label fetching (faster for testing)
         force: Force recomputation even if cached
         verbose: Print progress
+        n_jobs: UMAP compute threads (-1 = all cores); parallel callers
+            pass a reduced share so workers don't oversubscribe
+        neuronpedia_config: API config for label fetching (default budget
+            unless the caller divides it across workers)
 
     Returns:
         True if successful, False otherwise
@@ -88,7 +103,9 @@ def run_layer_pipeline(
 
         if force or not positions_path.exists():
             positions, edges = compute_layer_positions(
-                model_id, layer, cache_dir, force_recompute=force
+                model_id, layer, cache_dir,
+                umap_params=UMAPParams(n_jobs=n_jobs),
+                force_recompute=force,
             )
         else:
             if verbose:
@@ -103,12 +120,14 @@ def run_layer_pipeline(
                 print(f"\n[3/4] Fetching labels from Neuronpedia...")
             step_start = time.time()
 
+            labels_zst = cache_path / "labels.json.zst"
             labels_path = cache_path / "labels.json"
 
-            if force or not labels_path.exists():
+            if force or not (labels_zst.exists() or labels_path.exists()):
                 # Run async function
                 labels = asyncio.run(fetch_layer_labels(
-                    model_id, layer, top_k_labels, None, cache_dir, force
+                    model_id, layer, top_k_labels, None, cache_dir, force,
+                    config=neuronpedia_config,
                 ))
                 if verbose:
                     print(f"  Fetched {len(labels)} labels")
@@ -156,6 +175,7 @@ def run_pipeline(
     skip_labels: bool = False,
     force: bool = False,
     compress: bool = True,
+    n_workers: int = 1,
 ) -> dict:
     """
     Run the complete pipeline for multiple layers.
@@ -169,6 +189,7 @@ def run_pipeline(
         skip_labels: Skip label fetching
         force: Force recomputation
         compress: Gzip output files
+        n_workers: Worker processes for the per-layer loop (1 = sequential)
 
     Returns:
         Dict with success/failure counts and timing
@@ -194,30 +215,86 @@ def run_pipeline(
     print(f"Labels/layer: {top_k_labels if not skip_labels else 'skipped'}")
     print(f"Output: {output_dir}")
     print(f"Compress: {compress}")
+    print(f"Workers: {n_workers}")
     print(f"{'#'*60}")
 
     pipeline_start = time.time()
     successful = []
     failed = []
 
-    for i, layer in enumerate(layers):
-        print(f"\n[{i+1}/{len(layers)}] Layer {layer}")
-
-        success = run_layer_pipeline(
-            model_id=model_id,
-            layer=layer,
-            cache_dir=cache_dir,
-            output_config=output_config,
-            top_k_labels=top_k_labels,
-            skip_labels=skip_labels,
-            force=force,
-            verbose=True,
+    if n_workers > 1:
+        # Layers are fully independent (separate cache dirs, separate
+        # output files), so fan them out across a process pool. Each
+        # worker gets cpu_count() // n_workers compute threads, applied
+        # both through the pool initializer (BLAS/numba/faiss) and as
+        # UMAP's n_jobs.
+        worker_threads = max(1, (os.cpu_count() or 1) // n_workers)
+
+        # Each worker runs its own NeuronpediaClient, so the per-worker
+        # request budget must shrink for the aggregate rate to stay at
+        # requests_per_minute
+        worker_np_config = NeuronpediaConfig(
+            requests_per_minute=max(
+                1, DEFAULT_NEURONPEDIA_CONFIG.requests_per_minute // n_workers
+            ),
         )
 
-        if success:
-            successful.append(layer)
-        else:
-            failed.append(layer)
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_limit_worker_threads,
+            initargs=(worker_threads,),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    run_layer_pipeline,
+                    model_id=model_id,
+                    layer=layer,
+                    cache_dir=cache_dir,
+                    output_config=output_config,
+                    top_k_labels=top_k_labels,
+                    skip_labels=skip_labels,
+                    force=force,
+                    verbose=False,
+                    n_jobs=worker_threads,
+                    neuronpedia_config=worker_np_config,
+                ): layer
+                for layer in layers
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                layer = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    print(f"✗ [{i+1}/{len(layers)}] Layer {layer} failed: {e}")
+                    success = False
+                else:
+                    mark = "✓" if success else "✗"
+                    print(f"{mark} [{i+1}/{len(layers)}] Layer {layer}")
+
+                if success:
+                    successful.append(layer)
+                else:
+                    failed.append(layer)
+    else:
+        for i, layer in enumerate(layers):
+            print(f"\n[{i+1}/{len(layers)}] Layer {layer}")
+
+            success = run_layer_pipeline(
+                model_id=model_id,
+                layer=layer,
+                cache_dir=cache_dir,
+                output_config=output_config,
+                top_k_labels=top_k_labels,
+                skip_labels=skip_labels,
+                force=force,
+                verbose=True,
+            )
+
+            if success:
+                successful.append(layer)
+            else:
+                failed.append(layer)
 
     # Export manifest
     if successful:
@@ -280,6 +357,10 @@ def main():
         "--force", action="store_true",
         help="Force recomputation even if cached"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes for the per-layer loop (1 = sequential)"
+    )
 
     args = parser.parse_args()
 
@@ -304,6 +385,7 @@ def main():
         skip_labels=args.skip_labels,
         force=args.force,
         compress=not args.no_compress,
+        n_workers=args.workers,
     )
 
     # Exit with error code if any layers failed